@@ -44,7 +44,13 @@ import logging
 from typing import Any, Dict, List, Optional, Callable
 import os
 
-from blockchain import Blockchain, MINING_SENDER, MINING_REWARD, RECORD_TYPES
+from blockchain import (
+    Blockchain,
+    MINING_SENDER,
+    MINING_REWARD,
+    RECORD_TYPES,
+    RECORD_TYPE_VALUES,
+)
 from auth_service import validate_auth_header, AuthError
 
 logging.basicConfig(
@@ -382,8 +388,10 @@ def full_chain() -> Response:
                     "index": 10,
                     "timestamp": 1634567890.123,
                     "transactions": [...],
+                    "merkle_root": "root_of_block_10_transactions",
                     "nonce": 12345,
-                    "previous_hash": "hash_of_block_9"
+                    "previous_hash": "hash_of_block_9",
+                    "hash": "hash_of_block_10"
                 },
                 ...
             ],
@@ -459,10 +467,7 @@ def mine() -> Response:
     try:
         nonce = blockchain.proof_of_work()
 
-        last_block = blockchain.last_block
-        previous_hash = blockchain.hash(last_block)
-
-        block = blockchain.new_block(nonce, previous_hash)
+        block = blockchain.new_block(nonce, blockchain.last_hash)
 
         response: Dict[str, Any] = {
             "message": "New Block Forged",
@@ -643,8 +648,10 @@ def get_block(block_id: int) -> Response:
                 "index": 5,
                 "timestamp": 1634567890.123,
                 "transactions": [...],
+                "merkle_root": "root_of_block_5_transactions",
                 "nonce": 12345,
-                "previous_hash": "hash_of_block_4"
+                "previous_hash": "hash_of_block_4",
+                "hash": "hash_of_block_5"
             },
             "hash": "hash_of_block_5"
         }
@@ -652,11 +659,13 @@ def get_block(block_id: int) -> Response:
     if block_id < 0 or block_id >= len(blockchain.chain):
         return jsonify({"error": f"Block #{block_id} not found"}), 404
 
+    block = blockchain.chain[block_id]
+
     return (
         jsonify(
             {
-                "block": blockchain.chain[block_id],
-                "hash": blockchain.hash(blockchain.chain[block_id]),
+                "block": block,
+                "hash": block.get("hash") or blockchain.hash(block),
             }
         ),
         200,
@@ -724,7 +733,7 @@ def add_medical_record() -> Response:
     signature = values.get("signature")
     access_list = values.get("access_list", [patient_id, request.user_id])
 
-    if record_type not in RECORD_TYPES.values():
+    if not isinstance(record_type, str) or record_type not in RECORD_TYPE_VALUES:
         valid_types = ", ".join(RECORD_TYPES.values())
         return (
             jsonify({"error": f"Invalid record type. Must be one of: {valid_types}"}),
@@ -6,19 +6,30 @@ import binascii
 import hashlib
 import json
 import logging
+import multiprocessing
 import os
+import re
 import requests
-from collections import OrderedDict
-from time import time
-from typing import Any, Dict, List, Optional, Set, Union
+import struct
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from hashlib import sha256
+from time import time_ns
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple, Union
 from urllib.parse import urlparse
 from uuid import uuid4
 
 import base64
+from cryptography.exceptions import InvalidSignature, InvalidTag
 from cryptography.fernet import Fernet, InvalidToken
-from Crypto.Hash import SHA
-from Crypto.PublicKey import RSA
-from Crypto.Signature import pkcs1_15
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+import orjson
 
 from blockchain_exceptions import (
     EncryptionException,
@@ -41,6 +52,23 @@ MINING_SENDER = "THE BLOCKCHAIN"  # Special identifier for mining rewards
 MINING_REWARD = 1  # Amount of cryptocurrency rewarded for mining a block
 MINING_DIFFICULTY = 2  # Number of leading zeros required for proof-of-work
 KEY_FILE = "medical_encryption.key"  # File to store encryption keys
+NONCE_BATCH_SIZE = 1 << 16  # Nonces scanned per proof-of-work batch
+PUBLIC_KEY_CACHE_SIZE = 1024  # Parsed signer public keys kept in memory
+NONCE_STRUCT = struct.Struct(">Q")  # Proof-of-work nonce as a big-endian uint64
+# Transactions in a chain before validating it on all cores. Starting a
+# forkserver pool costs ~0.2s against ~3us per transaction checked serially
+PARALLEL_VALIDATION_MIN_TRANSACTIONS = 200_000
+PARALLEL_MINING_MIN_DIFFICULTY = 6  # Difficulty at which to mine on all cores
+AES_NONCE_SIZE = 12  # Bytes of random nonce prepended to each AES-GCM ciphertext
+CIPHERTEXT_VERSION = b"\x01"  # Format tag leading each AES-GCM ciphertext
+LEGACY_TOKEN_PREFIX = b"gAAAAA"  # Start of a Fernet token from before AES-GCM
+# Digit run that may be an integer beyond the 64-bit range orjson supports
+LONG_DIGIT_RUN = re.compile(rb"\d{20}")
+SIGNATURE_PLACEHOLDER = "SIGNATURE_PLACEHOLDER"  # Stands in for signed record data
+
+# Where a medical record sits on the chain (block index, transaction index),
+# with the IDs allowed to read it
+RecordPosition = Tuple[int, int, FrozenSet[str]]
 
 # Dictionary of valid medical record types supported by the blockchain
 RECORD_TYPES: Dict[str, str] = {
@@ -56,6 +84,340 @@ RECORD_TYPES: Dict[str, str] = {
     "CONSENT": "patient_consent",  # Patient consent forms
 }
 
+# Record type values for constant-time membership checks
+RECORD_TYPE_VALUES = frozenset(RECORD_TYPES.values())
+
+# Proof-of-work targets by difficulty: a SHA-256 digest read as a big-endian
+# integer has `difficulty` leading zero hex digits exactly when it is below
+# the target
+DIFFICULTY_TARGETS: Dict[int, int] = {
+    difficulty: 1 << (256 - 4 * difficulty) for difficulty in range(65)
+}
+
+
+def _canonical_json(obj: Any) -> bytes:
+    """
+    Serialize an object to canonical JSON bytes for hashing and signing.
+
+    Keys are sorted and no whitespace is emitted, so equal objects always
+    produce identical bytes regardless of dict insertion order.
+
+    Args:
+        obj (Any): JSON-serializable object
+
+    Returns:
+        bytes: UTF-8 encoded canonical JSON
+
+    Note:
+        Always encodes with orjson. Block hashes and signatures are computed
+        over these bytes, so every node must use the same encoder; the json
+        module formats floats differently (1e-07 vs 1e-7).
+    """
+    return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+
+
+def _dump_json(obj: Any) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON bytes without sorting keys.
+
+    Args:
+        obj (Any): JSON-serializable object
+
+    Returns:
+        bytes: UTF-8 encoded JSON
+
+    Raises:
+        TypeError: If the object is not JSON serializable
+
+    Note:
+        Falls back to the json module for data orjson rejects, such as
+        integers outside the 64-bit range. Unlike _canonical_json, the output
+        is never hashed, so it doesn't need to match across nodes.
+    """
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def _load_json(data: bytes) -> Any:
+    """
+    Parse UTF-8 JSON bytes.
+
+    Args:
+        data (bytes): UTF-8 encoded JSON
+
+    Returns:
+        Any: The decoded Python object
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON
+
+    Note:
+        orjson reads integers beyond 64 bits as floats, so data that may hold
+        one is parsed with the json module instead to keep its exact value.
+    """
+    if LONG_DIGIT_RUN.search(data):
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def _is_valid_key(key: bytes) -> bool:
+    """
+    Check that key material is a well-formed Fernet key.
+
+    The medical data key is derived from this material, so anything that
+    doesn't decode to 32 random bytes (an empty or truncated key file, say)
+    would give a key that is easy to guess.
+
+    Args:
+        key (bytes): Contents of the key file
+
+    Returns:
+        bool: True if the key is URL-safe base64 for exactly 32 bytes
+    """
+    try:
+        return len(base64.urlsafe_b64decode(key)) == 32
+    except (binascii.Error, ValueError):
+        return False
+
+
+def _is_chain_response(data: Any) -> bool:
+    """
+    Check the shape of a /chain response received from a peer.
+
+    Peer data is untrusted, so this runs before any of it is used.
+
+    Args:
+        data (Any): Decoded JSON body of the response
+
+    Returns:
+        bool: True if data is a dict whose "length" and optional "start" are
+            non-negative ints and whose "chain" is a list of block dicts
+    """
+    if not isinstance(data, dict):
+        return False
+
+    length = data.get("length")
+    start = data.get("start", 0)
+    chain = data.get("chain")
+    return (
+        type(length) is int
+        and type(start) is int
+        and length >= 0
+        and start >= 0
+        and isinstance(chain, list)
+        and all(isinstance(block, dict) for block in chain)
+    )
+
+
+def _timestamp() -> float:
+    """
+    Get the current wall-clock time in seconds, truncated to milliseconds.
+
+    Millisecond precision keeps timestamps short in JSON, so blocks and
+    records serialize and hash fewer bytes than with a full-precision float.
+
+    Returns:
+        float: Seconds since the epoch with at most three decimal places
+    """
+    return time_ns() // 1_000_000 / 1000
+
+
+@lru_cache(maxsize=PUBLIC_KEY_CACHE_SIZE)
+def _load_public_key(address: str) -> rsa.RSAPublicKey:
+    """
+    Parse a hex-encoded DER public key.
+
+    Results are cached because the same signers (e.g. a doctor's key across
+    many records) are verified over and over. Public keys are immutable, so
+    sharing the parsed objects is safe.
+
+    Args:
+        address (str): Hex-encoded DER public key (sender or provider address)
+
+    Returns:
+        rsa.RSAPublicKey: The parsed public key
+
+    Raises:
+        binascii.Error: If the address is not valid hex
+        ValueError: If the address is not a valid DER public key
+        TypeError: If the key is not an RSA key
+    """
+    public_key = serialization.load_der_public_key(binascii.unhexlify(address))
+    if not isinstance(public_key, rsa.RSAPublicKey):
+        raise TypeError("Address is not an RSA public key")
+    return public_key
+
+
+def _meets_difficulty(digest: bytes, difficulty: int) -> bool:
+    """
+    Check that a raw SHA-256 digest starts with `difficulty` zero hex digits.
+
+    Compares the digest, read as a big-endian integer, against the
+    precomputed target in DIFFICULTY_TARGETS. This needs no hexdigest string
+    and handles odd difficulties without a special case.
+
+    Args:
+        digest (bytes): Raw digest to check
+        difficulty (int): Number of leading zero hex digits required
+
+    Returns:
+        bool: True if the digest satisfies the difficulty
+    """
+    return int.from_bytes(digest, "big") < DIFFICULTY_TARGETS[difficulty]
+
+
+def _search_nonces(
+    prefix_hash: "hashlib._Hash", start: int, stop: int, difficulty: int
+) -> Optional[int]:
+    """
+    Scan a contiguous range of nonces for a valid proof.
+
+    This is the mining hot loop, so everything it touches is bound to locals
+    up front and the leading-zero check is inlined rather than calling
+    _meets_difficulty per attempt.
+
+    Args:
+        prefix_hash: SHA-256 object that has already absorbed the proof prefix
+        start (int): First nonce to try
+        stop (int): Nonce to stop before
+        difficulty (int): Number of leading zero hex digits required
+
+    Returns:
+        Optional[int]: The first valid nonce in the range, or None if none matched
+    """
+    target = DIFFICULTY_TARGETS[difficulty]
+    from_bytes = int.from_bytes
+    pack = NONCE_STRUCT.pack
+    copy = prefix_hash.copy
+
+    for nonce in range(start, stop):
+        guess_hash = copy()
+        guess_hash.update(pack(nonce))
+        if from_bytes(guess_hash.digest(), "big") < target:
+            return nonce
+
+    return None
+
+
+def _search_nonce_range(
+    prefix: bytes, start: int, stop: int, difficulty: int
+) -> Optional[int]:
+    """
+    Scan a range of nonces starting from the raw proof prefix.
+
+    Hash objects can't be pickled, so worker processes get the prefix bytes
+    and absorb it themselves before handing off to _search_nonces.
+
+    Args:
+        prefix (bytes): The proof-of-work input prefix
+        start (int): First nonce to try
+        stop (int): Nonce to stop before
+        difficulty (int): Number of leading zero hex digits required
+
+    Returns:
+        Optional[int]: The first valid nonce in the range, or None if none matched
+    """
+    return _search_nonces(sha256(prefix), start, stop, difficulty)
+
+
+def _process_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Create a process pool that is safe to start from a threaded server.
+
+    Pools are created inside Flask request threads, often right after a thread
+    pool fan-out. Forking there could copy a lock (e.g. the logging lock) held
+    by another thread into the workers and deadlock them, so workers are
+    started from a clean forkserver process instead, or spawned where
+    forkserver isn't available.
+
+    Args:
+        max_workers (Optional[int]): Number of worker processes, all CPUs if None
+
+    Returns:
+        ProcessPoolExecutor: The new pool
+    """
+    start_method = (
+        "forkserver"
+        if "forkserver" in multiprocessing.get_all_start_methods()
+        else "spawn"
+    )
+    return ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context(start_method)
+    )
+
+
+def _check_block(block: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Run the checks on a block that do not depend on the rest of the chain.
+
+    Verifies that the block's transactions are a list of dicts, its Merkle
+    root against those transactions and its proof-of-work against its own
+    previous_hash, then recomputes its hash. Linking blocks together is left to
+    the caller. Defined at module level so valid_chain can hand it to worker
+    processes.
+
+    Args:
+        block (Dict[str, Any]): Block to check
+
+    Returns:
+        Tuple[Optional[str], Optional[str]]: The recomputed block hash and None
+            if the block is valid, or None and the name of the failed check
+    """
+    transactions = block.get("transactions", [])
+    if not isinstance(transactions, list) or not all(
+        isinstance(transaction, dict) for transaction in transactions
+    ):
+        return None, "transactions"
+
+    merkle_root = Blockchain.merkle_root(transactions)
+    if block.get("merkle_root") != merkle_root:
+        return None, "merkle root"
+
+    if not Blockchain.valid_proof(
+        merkle_root,
+        block.get("previous_hash", ""),
+        block.get("nonce", 0),
+        MINING_DIFFICULTY,
+    ):
+        return None, "proof of work"
+
+    return Blockchain.hash(block), None
+
+
+@handle_exceptions(
+    {
+        OSError: lambda e: logger.warning(
+            "Process pool unavailable, validating serially: %s", str(e)
+        )
+        or None,
+        BrokenProcessPool: lambda e: logger.warning(
+            "Process pool broke, validating serially: %s", str(e)
+        )
+        or None,
+    }
+)
+def _check_blocks_in_pool(
+    blocks: List[Dict[str, Any]], cpu_count: int
+) -> Optional[List[Tuple[Optional[str], Optional[str]]]]:
+    """
+    Run _check_block over blocks on a process pool.
+
+    Args:
+        blocks (List[Dict[str, Any]]): Blocks to check
+        cpu_count (int): Number of CPUs the pool will use
+
+    Returns:
+        Optional[List[Tuple[Optional[str], Optional[str]]]]: _check_block's
+            result for each block, or None if the pool could not be started or
+            broke, e.g. on hosts without /dev/shm, so the caller can check the
+            blocks serially instead
+    """
+    chunksize = max(1, len(blocks) // (4 * cpu_count))
+    with _process_pool() as executor:
+        return list(executor.map(_check_block, blocks, chunksize=chunksize))
+
 
 class Blockchain:
     """
@@ -86,30 +448,58 @@ class Blockchain:
             transactions (List[Dict]): Current pending transactions
             nodes (Set[str]): Set of registered nodes in the network
             node_id (str): Unique identifier for this blockchain node
-            encryption_key (bytes): Key used for encrypting/decrypting medical data
+            encryption_key (bytes): Key material loaded from KEY_FILE
+            data_key (bytes): AES-256 key derived from encryption_key for medical data
         """
         self.chain: List[Dict[str, Any]] = []
         self.transactions: List[Dict[str, Any]] = []
+        # Merkle leaf hashes of the pending transactions, computed on arrival
+        self._pending_leaves: List[bytes] = []
         self.nodes: Set[str] = set()
+        # /chain endpoint of each registered node, built once at registration
+        self._node_urls: List[str] = []
         self.node_id: str = str(uuid4()).replace("-", "")
 
+        # Pooled HTTP session so consensus rounds reuse connections to nodes
+        self._session = requests.Session()
+
+        # Positions of medical records on the chain, keyed by patient and by
+        # (patient, record type)
+        self._patient_index: Dict[str, List[RecordPosition]] = {}
+        self._record_type_index: Dict[Tuple[str, str], List[RecordPosition]] = {}
+
         # Create the genesis block
         self.new_block(0, "00")
 
         # Generate or load encryption key
         self.encryption_key = self._get_or_create_encryption_key()
+        self.data_key = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=b"medical-data",
+        ).derive(self.encryption_key)
+        # One cipher object for all medical data instead of one per call
+        self._aead = AESGCM(self.data_key)
+        # Fernet cipher for legacy records, created on first use
+        self._legacy_fernet: Optional[Fernet] = None
 
     def _get_or_create_encryption_key(self) -> bytes:
         """
         Generate or load a key for encrypting sensitive medical data.
 
         Attempts to load an existing encryption key from the KEY_FILE.
-        If the file doesn't exist, generates a new Fernet key and saves it.
-        Sets proper file permissions to protect the key.
+        If the file doesn't exist or is empty, generates a new Fernet key and
+        saves it. Sets proper file permissions to protect the key.
 
         Returns:
             bytes: The encryption key for securing medical data
 
+        Raises:
+            EncryptionException: If KEY_FILE holds something other than a valid
+                Fernet key. It is left untouched rather than overwritten, since
+                it may be a damaged copy of a key that existing records need.
+
         Note:
             If there's an error accessing the key file, falls back to an
             in-memory temporary key (which won't persist between restarts).
@@ -117,7 +507,20 @@ class Blockchain:
         try:
             if os.path.exists(KEY_FILE):
                 with open(KEY_FILE, "rb") as f:
-                    return f.read()
+                    key = f.read().strip()
+
+                if _is_valid_key(key):
+                    return key
+
+                if key:
+                    logger.error("Encryption key file %s is malformed", KEY_FILE)
+                    raise EncryptionException(
+                        f"Encryption key file {KEY_FILE} is not a valid key"
+                    )
+
+                logger.error(
+                    "Encryption key file %s is empty, generating a new key", KEY_FILE
+                )
 
             key = Fernet.generate_key()
             os.makedirs(os.path.dirname(KEY_FILE) or ".", exist_ok=True)
@@ -136,8 +539,9 @@ class Blockchain:
         """
         Encrypt sensitive medical data.
 
-        Converts data to JSON, encrypts it using Fernet symmetric encryption,
-        and encodes the result in base64 for storage in the blockchain.
+        Converts data to JSON and encrypts it with AES-256-GCM under a fresh
+        random nonce. The format tag, nonce and ciphertext are base64-encoded
+        once for storage in the blockchain.
 
         Args:
             data (Any): The medical data to encrypt (must be JSON serializable)
@@ -157,8 +561,6 @@ class Blockchain:
                 "JSON error during encryption: %s", str(e)
             )
             or None,
-            InvalidToken: lambda e: logger.error("Invalid Fernet token: %s", str(e))
-            or None,
         }
 
         @handle_exceptions(
@@ -168,13 +570,28 @@ class Blockchain:
             if not data:
                 return None
 
-            f = Fernet(self.encryption_key)
-            json_data = json.dumps(data)
-            encrypted_data = f.encrypt(json_data.encode())
-            return base64.b64encode(encrypted_data).decode()
+            return self._seal(data)
 
         return _encrypt()
 
+    def _seal(self, data: Any) -> str:
+        """
+        Serialize and encrypt medical data in the stored ciphertext format.
+
+        Args:
+            data (Any): JSON-serializable data to encrypt
+
+        Returns:
+            str: Base64 of the format tag, a fresh random nonce and the
+                AES-256-GCM ciphertext
+
+        Raises:
+            TypeError: If the data is not JSON serializable
+        """
+        nonce = os.urandom(AES_NONCE_SIZE)
+        encrypted_data = self._aead.encrypt(nonce, _dump_json(data), None)
+        return base64.b64encode(CIPHERTEXT_VERSION + nonce + encrypted_data).decode()
+
     def decrypt_medical_data(
         self, encrypted_data: Optional[str], authorized: bool = False
     ) -> Optional[Any]:
@@ -209,23 +626,62 @@ class Blockchain:
                 "JSON error during decryption: %s", str(e)
             )
             or None,
-            InvalidToken: lambda e: logger.error("Invalid Fernet token: %s", str(e))
+            InvalidTag: lambda e: logger.error(
+                "Medical data failed authentication during decryption"
+            )
+            or None,
+            InvalidToken: lambda e: logger.error(
+                "Legacy medical data failed authentication during decryption"
+            )
             or None,
             binascii.Error: lambda e: logger.error("Base64 decoding error: %s", str(e))
             or None,
+            ValueError: lambda e: logger.error(
+                "Value error during decryption: %s", str(e)
+            )
+            or None,
         }
 
         @handle_exceptions(
             decryption_handlers, fallback_handler=default_fallback_handler
         )
         def _decrypt():
-            f = Fernet(self.encryption_key)
             decoded = base64.b64decode(encrypted_data)
-            decrypted_data = f.decrypt(decoded).decode()
-            return json.loads(decrypted_data)
+            if decoded.startswith(LEGACY_TOKEN_PREFIX):
+                return self._decrypt_legacy_medical_data(decoded)
+
+            if not decoded.startswith(CIPHERTEXT_VERSION):
+                raise ValueError("Unknown medical data format")
+
+            nonce_end = len(CIPHERTEXT_VERSION) + AES_NONCE_SIZE
+            decrypted_data = self._aead.decrypt(
+                decoded[len(CIPHERTEXT_VERSION) : nonce_end], decoded[nonce_end:], None
+            )
+            return _load_json(decrypted_data)
 
         return _decrypt()
 
+    def _decrypt_legacy_medical_data(self, token: bytes) -> Any:
+        """
+        Decrypt medical data written before the switch to AES-GCM.
+
+        Older records hold a base64-encoded Fernet token, so they can't be read
+        through the AES-GCM path. Blocks are immutable, so these records are
+        decoded on read rather than rewritten.
+
+        Args:
+            token (bytes): The Fernet token, already stripped of its outer base64
+
+        Returns:
+            Any: The decrypted data as a Python object
+
+        Raises:
+            InvalidToken: If the token is malformed or fails authentication
+        """
+        if self._legacy_fernet is None:
+            self._legacy_fernet = Fernet(self.encryption_key)
+        return _load_json(self._legacy_fernet.decrypt(token))
+
     def new_block(
         self, nonce: int, previous_hash: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -243,25 +699,141 @@ class Blockchain:
         Returns:
             Dict[str, Any]: The newly created block
 
+        Raises:
+            ValueError: If the nonce is not a valid proof for the pending
+                transactions, e.g. because a transaction arrived after
+                proof_of_work ran. The transactions stay pending.
+
         Note:
-            After creating a block, the pending transaction list is cleared
+            After creating a block, the pending transaction list is cleared.
+            The block's own hash is computed once here and cached under "hash"
         """
-        prev_hash = (
-            previous_hash if previous_hash is not None else self.hash(self.chain[-1])
-        )
+        prev_hash = previous_hash if previous_hash is not None else self.last_hash
+
+        # Hand the pending lists over to the block instead of copying them, so
+        # transactions arriving from here on go into the next block
+        transactions, leaves = self.transactions, self._pending_leaves
+        self.transactions = []
+        self._pending_leaves = []
+        if len(leaves) == len(transactions):
+            merkle_root = self._merkle_root_from_leaves(leaves)
+        else:
+            merkle_root = self.merkle_root(transactions)
+
+        # The genesis block is the only one sealed without a proof of work
+        if self.chain and not self.valid_proof(
+            merkle_root, prev_hash, nonce, MINING_DIFFICULTY
+        ):
+            self.transactions[:0] = transactions
+            self._pending_leaves[:0] = leaves
+            raise ValueError("Proof of work does not match the pending transactions")
 
         block = {
             "index": len(self.chain) + 1,
-            "timestamp": time(),
-            "transactions": self.transactions.copy(),
+            "timestamp": _timestamp(),
+            "transactions": transactions,
+            "merkle_root": merkle_root,
             "nonce": nonce,
             "previous_hash": prev_hash,
         }
+        block["hash"] = self.hash(block)
 
-        self.transactions = []
         self.chain.append(block)
+        self._index_block(
+            len(self.chain) - 1, block, self._patient_index, self._record_type_index
+        )
         return block
 
+    @staticmethod
+    def _index_block(
+        block_idx: int,
+        block: Dict[str, Any],
+        patient_index: Dict[str, List[RecordPosition]],
+        record_type_index: Dict[Tuple[str, str], List[RecordPosition]],
+    ) -> None:
+        """
+        Add the medical records of a block to patient record indices.
+
+        Transactions that aren't dicts or have no string patient_id can never
+        be looked up by patient, so they are skipped rather than indexed.
+
+        Args:
+            block_idx (int): Position of the block in the chain
+            block (Dict[str, Any]): The block whose transactions to index
+            patient_index (Dict[str, List[RecordPosition]]): Index by patient
+            record_type_index (Dict[Tuple[str, str], List[RecordPosition]]):
+                Index by (patient, record type)
+        """
+        for tx_idx, transaction in enumerate(block.get("transactions", [])):
+            if (
+                not isinstance(transaction, dict)
+                or transaction.get("type") != "MEDICAL_RECORD"
+            ):
+                continue
+
+            patient_id = transaction.get("patient_id")
+            if not isinstance(patient_id, str):
+                continue
+            patient_id = sys.intern(patient_id)
+
+            # Interned IDs share one string per user across every record, and
+            # the frozenset makes the access check a hash lookup. Only strings
+            # can ever match a requester ID, so anything else is dropped.
+            access = frozenset(
+                sys.intern(user_id)
+                for user_id in transaction.get("access_list") or ()
+                if isinstance(user_id, str)
+            )
+            position = (block_idx, tx_idx, access)
+            patient_index.setdefault(patient_id, []).append(position)
+            record_type = transaction.get("record_type")
+            if isinstance(record_type, str):
+                record_type_index.setdefault((patient_id, record_type), []).append(
+                    position
+                )
+
+    def _build_record_index(
+        self, chain: List[Dict[str, Any]], start: int = 0
+    ) -> Tuple[
+        Dict[str, List[RecordPosition]], Dict[Tuple[str, str], List[RecordPosition]]
+    ]:
+        """
+        Build the patient record indices for a replacement chain.
+
+        Called whenever the chain is replaced, e.g. by consensus. Entries for
+        blocks before `start` are copied from the current indices, so only the
+        replaced part is reindexed. The current indices are left untouched, so
+        the caller can swap the chain and its indices in together.
+
+        Args:
+            chain (List[Dict[str, Any]]): The chain that will replace ours
+            start (int): Position of the first block that changed
+
+        Returns:
+            Tuple[Dict, Dict]: The new index by patient and the new index by
+                (patient, record type)
+        """
+        patient_index: Dict[str, List[RecordPosition]] = {}
+        record_type_index: Dict[Tuple[str, str], List[RecordPosition]] = {}
+        if start > 0:
+            for source, target in (
+                (self._patient_index, patient_index),
+                (self._record_type_index, record_type_index),
+            ):
+                for key, positions in source.items():
+                    # Positions are appended in chain order, so cut off the tail
+                    end = len(positions)
+                    while end and positions[end - 1][0] >= start:
+                        end -= 1
+                    if end:
+                        target[key] = positions[:end]
+
+        for block_idx in range(start, len(chain)):
+            self._index_block(
+                block_idx, chain[block_idx], patient_index, record_type_index
+            )
+        return patient_index, record_type_index
+
     def new_transaction(self, sender: str, recipient: str, amount: int) -> int:
         """
         Add a new transaction to pending transactions.
@@ -276,7 +848,7 @@ class Blockchain:
         Returns:
             int: Index of the block that will contain this transaction
         """
-        self.transactions.append(
+        self._add_transaction(
             {"sender": sender, "recipient": recipient, "amount": amount}
         )
         return self.last_block["index"] + 1
@@ -288,7 +860,8 @@ class Blockchain:
 
         Generates a unique hash representing the block contents.
         This is critical for maintaining the immutability and
-        integrity of the blockchain.
+        integrity of the blockchain. The cached "hash" field, if present,
+        is not part of the hashed contents.
 
         Args:
             block (Dict[str, Any]): Block to hash
@@ -296,8 +869,79 @@ class Blockchain:
         Returns:
             str: Hexadecimal string representation of the block hash
         """
-        block_string = json.dumps(block, sort_keys=True).encode()
-        return hashlib.sha256(block_string).hexdigest()
+        if "hash" in block:
+            block = {key: value for key, value in block.items() if key != "hash"}
+        return sha256(_canonical_json(block)).hexdigest()
+
+    @staticmethod
+    def merkle_root(transactions: List[Dict[str, Any]]) -> str:
+        """
+        Compute the Merkle root committing to a list of transactions.
+
+        Each transaction is hashed from its canonical JSON form, then the
+        hashes are combined pairwise until one remains. On odd levels the
+        last hash is paired with itself. This lets proof-of-work hash a
+        fixed-size commitment instead of the full transaction list.
+
+        Args:
+            transactions (List[Dict[str, Any]]): Transactions to commit to
+
+        Returns:
+            str: Hexadecimal Merkle root (hash of empty input if there are none)
+        """
+        return Blockchain._merkle_root_from_leaves(
+            [sha256(_canonical_json(tx)).digest() for tx in transactions]
+        )
+
+    @staticmethod
+    def _merkle_root_from_leaves(leaves: List[bytes]) -> str:
+        """
+        Combine Merkle leaf hashes pairwise into the root.
+
+        Args:
+            leaves (List[bytes]): SHA-256 digests of the canonical transactions
+
+        Returns:
+            str: Hexadecimal Merkle root (hash of empty input if there are no leaves)
+        """
+        if not leaves:
+            return sha256(b"").hexdigest()
+
+        level = list(leaves)
+
+        while len(level) > 1:
+            if len(level) % 2:
+                level.append(level[-1])
+            level = [
+                sha256(level[i] + level[i + 1]).digest()
+                for i in range(0, len(level), 2)
+            ]
+
+        return level[0].hex()
+
+    def _add_transaction(self, transaction: Dict[str, Any]) -> None:
+        """
+        Append a transaction to the pending pool along with its Merkle leaf.
+
+        Args:
+            transaction (Dict[str, Any]): The transaction or medical record to add
+        """
+        self.transactions.append(transaction)
+        self._pending_leaves.append(sha256(_canonical_json(transaction)).digest())
+
+    def _pending_merkle_root(self) -> str:
+        """
+        Get the Merkle root of the pending transactions.
+
+        Uses the leaf hashes computed as transactions arrived, and falls back
+        to hashing the transactions if the pending list was modified directly.
+
+        Returns:
+            str: Hexadecimal Merkle root of the pending transactions
+        """
+        if len(self._pending_leaves) != len(self.transactions):
+            return self.merkle_root(self.transactions)
+        return self._merkle_root_from_leaves(self._pending_leaves)
 
     @property
     def last_block(self) -> Dict[str, Any]:
@@ -309,32 +953,114 @@ class Blockchain:
         """
         return self.chain[-1]
 
+    @property
+    def last_hash(self) -> str:
+        """
+        Get the hash of the last block in the chain.
+
+        Returns:
+            str: The hash cached on the block when it was created, computed
+                 on demand for blocks that predate the cache
+        """
+        last_block = self.chain[-1]
+        return last_block.get("hash") or self.hash(last_block)
+
     def proof_of_work(self) -> int:
         """
         Find a nonce that produces a hash with leading zeros.
 
         Implements the Proof of Work consensus algorithm, which requires
-        finding a number (nonce) that when combined with the previous block's hash
-        produces a hash with a certain number of leading zeros.
+        finding a number (nonce) that when combined with the Merkle root of the
+        pending transactions and the previous block's hash produces a hash
+        with a certain number of leading zeros.
 
         Returns:
             int: The nonce that satisfies the difficulty requirement
 
         Note:
-            The difficulty is controlled by MINING_DIFFICULTY constant
+            - The difficulty is controlled by MINING_DIFFICULTY constant
+            - From PARALLEL_MINING_MIN_DIFFICULTY on, the search is spread over
+              all cores; below it, starting the workers costs more than it saves
+        """
+        prefix = self.proof_prefix(self._pending_merkle_root(), self.last_hash)
+
+        cpu_count = os.cpu_count() or 1
+        if cpu_count > 1 and MINING_DIFFICULTY >= PARALLEL_MINING_MIN_DIFFICULTY:
+            return self._parallel_proof_of_work(prefix, cpu_count)
+
+        # Absorb the constant prefix once; each attempt only hashes the nonce
+        prefix_hash = sha256(prefix)
+
+        start = 0
+        while True:
+            nonce = _search_nonces(
+                prefix_hash, start, start + NONCE_BATCH_SIZE, MINING_DIFFICULTY
+            )
+            if nonce is not None:
+                return nonce
+            start += NONCE_BATCH_SIZE
+
+    @staticmethod
+    def _parallel_proof_of_work(prefix: bytes, workers: int) -> int:
+        """
+        Search for a valid nonce on several processes at once.
+
+        Each round hands every worker its own batch of NONCE_BATCH_SIZE
+        consecutive nonces. Processes are used rather than threads because
+        hashlib holds the GIL while hashing inputs this small.
+
+        Args:
+            prefix (bytes): The proof-of-work input prefix
+            workers (int): Number of worker processes
+
+        Returns:
+            int: The lowest valid nonce found in the first successful round
+        """
+        with _process_pool(workers) as executor:
+            start = 0
+            while True:
+                futures = [
+                    executor.submit(
+                        _search_nonce_range,
+                        prefix,
+                        batch_start,
+                        batch_start + NONCE_BATCH_SIZE,
+                        MINING_DIFFICULTY,
+                    )
+                    for batch_start in range(
+                        start, start + workers * NONCE_BATCH_SIZE, NONCE_BATCH_SIZE
+                    )
+                ]
+                start += workers * NONCE_BATCH_SIZE
+
+                # Check batches in order so the result doesn't depend on timing
+                for future in futures:
+                    nonce = future.result()
+                    if nonce is not None:
+                        return nonce
+
+    @staticmethod
+    def proof_prefix(merkle_root: str, last_hash: str) -> bytes:
         """
-        last_block = self.last_block
-        last_hash = self.hash(last_block)
+        Build the constant part of the proof-of-work input.
 
-        nonce = 0
-        while not self.valid_proof(self.transactions, last_hash, nonce):
-            nonce += 1
+        The raw 32-byte Merkle root is followed by the raw 32-byte previous
+        block hash. The prefix fills exactly one SHA-256 block, so the mined
+        state can be reused and each attempt only compresses the final block
+        holding the 8-byte nonce (see NONCE_STRUCT).
 
-        return nonce
+        Args:
+            merkle_root (str): Merkle root of the block's transactions
+            last_hash (str): Hash of the previous block
+
+        Returns:
+            bytes: The proof-of-work input prefix
+        """
+        return bytes.fromhex(merkle_root) + bytes.fromhex(last_hash)
 
     @staticmethod
     def valid_proof(
-        transactions: List[Dict[str, Any]],
+        merkle_root: str,
         last_hash: str,
         nonce: int,
         difficulty: int = MINING_DIFFICULTY,
@@ -343,10 +1069,10 @@ class Blockchain:
         Validate the proof of work.
 
         Checks if a given nonce creates a hash with the required number
-        of leading zeros when combined with the transactions and previous hash.
+        of leading zeros when combined with the Merkle root and previous hash.
 
         Args:
-            transactions (List[Dict]): List of transactions to include in the proof
+            merkle_root (str): Merkle root of the block's transactions
             last_hash (str): Hash of the previous block
             nonce (int): The proof-of-work nonce to validate
             difficulty (int): Number of leading zeros required (default: MINING_DIFFICULTY)
@@ -354,9 +1080,9 @@ class Blockchain:
         Returns:
             bool: True if the proof is valid, False otherwise
         """
-        guess = (str(transactions) + str(last_hash) + str(nonce)).encode()
-        guess_hash = hashlib.sha256(guess).hexdigest()
-        return guess_hash[:difficulty] == "0" * difficulty
+        guess_hash = sha256(Blockchain.proof_prefix(merkle_root, last_hash))
+        guess_hash.update(NONCE_STRUCT.pack(nonce))
+        return _meets_difficulty(guess_hash.digest(), difficulty)
 
     def register_node(self, address: str) -> None:
         """
@@ -376,15 +1102,19 @@ class Blockchain:
         try:
             parsed_url = urlparse(address)
             if parsed_url.netloc:
-                self.nodes.add(parsed_url.netloc)
+                netloc = parsed_url.netloc
             elif parsed_url.path:
                 # Accept URLs without scheme like '192.168.0.5:5000'
-                self.nodes.add(parsed_url.path)
+                netloc = parsed_url.path
             else:
                 raise ValueError("Invalid URL")
         except ValueError as e:
             raise ValueError(f"Invalid URL: {e}") from e
 
+        if netloc not in self.nodes:
+            self.nodes.add(netloc)
+            self._node_urls.append(f"http://{netloc}/chain")
+
     def verify_transaction_signature(
         self, sender_address: str, signature: str, transaction: Dict[str, Any]
     ) -> bool:
@@ -392,7 +1122,7 @@ class Blockchain:
         Verify the signature of a transaction.
 
         Confirms that a transaction was signed by the owner of the sender address
-        using RSA digital signatures (PKCS#1 v1.5).
+        using RSA digital signatures (PKCS#1 v1.5 over SHA-256).
 
         Args:
             sender_address (str): Hex-encoded public key of the sender
@@ -403,7 +1133,9 @@ class Blockchain:
             bool: True if signature is valid, False otherwise or if verification fails
 
         Note:
-            Uses exception handlers to gracefully manage verification errors
+            - The signed message is the canonical (sorted-key, compact) JSON
+              encoding of the transaction, the same form used for block hashes
+            - Uses exception handlers to gracefully manage verification errors
         """
         signature_handlers = {
             ValueError: lambda e: logger.error(
@@ -418,14 +1150,21 @@ class Blockchain:
                 "Binascii error during signature verification: %s", str(e)
             )
             or False,
+            InvalidSignature: lambda e: logger.error(
+                "Invalid transaction signature from %s", sender_address
+            )
+            or False,
         }
 
         @handle_exceptions(signature_handlers, fallback_handler=lambda e: False)
         def _verify():
-            public_key = RSA.importKey(binascii.unhexlify(sender_address))
-            verifier = pkcs1_15.new(public_key)
-            h = SHA.new(str(transaction).encode("utf8"))
-            verifier.verify(h, binascii.unhexlify(signature))
+            public_key = _load_public_key(sender_address)
+            public_key.verify(
+                binascii.unhexlify(signature),
+                _canonical_json(transaction),
+                padding.PKCS1v15(),
+                hashes.SHA256(),
+            )
             return True
 
         return _verify()
@@ -453,20 +1192,18 @@ class Blockchain:
         Note:
             Mining rewards (from MINING_SENDER) don't require signature verification
         """
-        transaction = OrderedDict(
-            {
-                "sender_address": sender_address,
-                "recipient_address": recipient_address,
-                "value": value,
-            }
-        )
+        transaction = {
+            "sender_address": sender_address,
+            "recipient_address": recipient_address,
+            "value": value,
+        }
 
         if sender_address == MINING_SENDER:
-            self.transactions.append(transaction)
+            self._add_transaction(transaction)
             return len(self.chain) + 1
 
         if self.verify_transaction_signature(sender_address, signature, transaction):
-            self.transactions.append(transaction)
+            self._add_transaction(transaction)
             return len(self.chain) + 1
 
         return False
@@ -514,7 +1251,10 @@ class Blockchain:
 
         @handle_exceptions(record_handlers, fallback_handler=lambda e: False)
         def _create_record():
-            if record_type not in RECORD_TYPES.values():
+            if (
+                not isinstance(record_type, str)
+                or record_type not in RECORD_TYPE_VALUES
+            ):
                 raise ValueError(
                     f"Invalid record type. Must be one of: {', '.join(RECORD_TYPES.values())}"
                 )
@@ -524,17 +1264,15 @@ class Blockchain:
                 logger.error("Failed to encrypt medical data")
                 return False
 
-            record = OrderedDict(
-                {
-                    "type": "MEDICAL_RECORD",
-                    "patient_id": patient_id,
-                    "doctor_id": doctor_id,
-                    "record_type": record_type,
-                    "data": encrypted_data,
-                    "timestamp": time(),
-                    "access_list": access_list or [patient_id, doctor_id],
-                }
-            )
+            record = {
+                "type": "MEDICAL_RECORD",
+                "patient_id": patient_id,
+                "doctor_id": doctor_id,
+                "record_type": record_type,
+                "data": encrypted_data,
+                "timestamp": _timestamp(),
+                "access_list": access_list or [patient_id, doctor_id],
+            }
 
             if doctor_id != MINING_SENDER and not self.verify_record_signature(
                 doctor_id, signature, record
@@ -544,7 +1282,7 @@ class Blockchain:
                 )
                 return False
 
-            self.transactions.append(record)
+            self._add_transaction(record)
             return self.last_block["index"] + 1
 
         return _create_record()
@@ -570,6 +1308,8 @@ class Blockchain:
             - Special "DEBUG_SKIP_VERIFICATION" signature bypasses verification for testing
             - During verification, the encrypted data is replaced with a placeholder
               to ensure consistent verification regardless of encryption
+            - Signatures are RSA PKCS#1 v1.5 over SHA-256 of the record's canonical
+              JSON (sorted keys, no whitespace)
         """
         if signature == "DEBUG_SKIP_VERIFICATION":
             logger.warning("Skipping signature verification in DEBUG mode")
@@ -592,22 +1332,27 @@ class Blockchain:
                 "Binascii error during record signature verification: %s", str(e)
             )
             or False,
+            InvalidSignature: lambda e: logger.error(
+                "Invalid record signature from %s", provider_id
+            )
+            or False,
         }
 
         @handle_exceptions(signature_handlers, fallback_handler=lambda e: False)
         def _verify():
-            record_for_verification = record.copy()
-            if "data" in record_for_verification:
-                record_for_verification["data"] = "SIGNATURE_PLACEHOLDER"
-
-            public_key = RSA.importKey(binascii.unhexlify(provider_id))
-            verifier = pkcs1_15.new(public_key)
-
-            record_hash = SHA.new(
-                json.dumps(record_for_verification, sort_keys=True).encode("utf8")
+            # Swap in the placeholder while building the dict, so the encrypted
+            # blob is never serialized and the caller's record is left alone
+            signed_record = record
+            if "data" in record:
+                signed_record = {**record, "data": SIGNATURE_PLACEHOLDER}
+
+            public_key = _load_public_key(provider_id)
+            public_key.verify(
+                binascii.unhexlify(signature),
+                _canonical_json(signed_record),
+                padding.PKCS1v15(),
+                hashes.SHA256(),
             )
-
-            verifier.verify(record_hash, binascii.unhexlify(signature))
             return True
 
         return _verify()
@@ -618,9 +1363,10 @@ class Blockchain:
         """
         Retrieve authorized medical records for a patient.
 
-        Searches the entire blockchain for medical records belonging to a
-        specific patient. Only returns records that the requester is authorized
-        to access, and optionally filters by record type.
+        Looks up the medical records belonging to a specific patient through
+        the patient record index, so only that patient's records are visited
+        rather than every transaction on the chain. Only returns records that
+        the requester is authorized to access, and optionally filters by record type.
 
         Args:
             patient_id (str): ID of the patient whose records to retrieve
@@ -638,29 +1384,23 @@ class Blockchain:
         """
         records = []
 
-        for block in self.chain:
-            for transaction in block["transactions"]:
-                if (
-                    transaction.get("type") == "MEDICAL_RECORD"
-                    and transaction.get("patient_id") == patient_id
-                ):
+        if record_type:
+            positions = self._record_type_index.get((patient_id, record_type), [])
+        else:
+            positions = self._patient_index.get(patient_id, [])
 
-                    if record_type and transaction.get("record_type") != record_type:
-                        continue
+        for block_idx, tx_idx, access in positions:
+            if requester_id in access:
+                transaction = self.chain[block_idx]["transactions"][tx_idx]
+                record = transaction.copy()
 
-                    access_list = transaction.get("access_list", [])
-                    if requester_id in access_list:
-                        record = transaction.copy()
+                if "data" in record and record["data"]:
+                    decrypted_data = self.decrypt_medical_data(
+                        record["data"], authorized=True
+                    )
+                    record["data"] = decrypted_data if decrypted_data else "ENCRYPTED"
 
-                        if "data" in record and record["data"]:
-                            decrypted_data = self.decrypt_medical_data(
-                                record["data"], authorized=True
-                            )
-                            record["data"] = (
-                                decrypted_data if decrypted_data else "ENCRYPTED"
-                            )
-
-                        records.append(record)
+                records.append(record)
 
         return records
 
@@ -669,8 +1409,10 @@ class Blockchain:
         Validate the entire blockchain.
 
         Ensures the integrity of a blockchain by verifying that:
-        1. Each block's previous_hash matches the hash of the actual previous block
-        2. The proof-of-work for each block is valid
+        1. Each block's previous_hash matches the hash of the actual previous block,
+           and any cached "hash" field matches the recomputed hash
+        2. Each block's merkle_root matches its transactions
+        3. The proof-of-work for each block is valid
 
         Args:
             chain (List[Dict[str, Any]]): Blockchain to validate
@@ -680,7 +1422,10 @@ class Blockchain:
 
         Note:
             This is critical for the consensus mechanism and resolving conflicts
-            between nodes in the distributed network.
+            between nodes in the distributed network. On multi-core machines,
+            chains of at least PARALLEL_VALIDATION_MIN_TRANSACTIONS
+            transactions are checked on a process pool, or serially if the
+            pool can't be used.
         """
         validation_handlers = {
             Exception: lambda e: logger.error("Chain validation error: %s", str(e))
@@ -692,52 +1437,86 @@ class Blockchain:
             if not chain:
                 return False
 
-            last_block = chain[0]
-            current_index = 1
-
-            while current_index < len(chain):
-                block = chain[current_index]
+            last_hash = self.hash(chain[0])
+            if chain[0].get("hash", last_hash) != last_hash:
+                logger.warning("Invalid cached hash at block 0")
+                return False
 
-                if block.get("previous_hash") != self.hash(last_block):
+            blocks = chain[1:]
+            cpu_count = os.cpu_count() or 1
+            results = None
+            if cpu_count > 1:
+                transaction_count = sum(
+                    len(transactions)
+                    for transactions in (block.get("transactions") for block in blocks)
+                    if isinstance(transactions, list)
+                )
+                if transaction_count >= PARALLEL_VALIDATION_MIN_TRANSACTIONS:
+                    # Per-block checks are independent, so spread them over cores
+                    results = _check_blocks_in_pool(blocks, cpu_count)
+            if results is None:
+                results = map(_check_block, blocks)
+
+            for current_index, (block, (block_hash, error)) in enumerate(
+                zip(blocks, results), start=1
+            ):
+                if block.get("previous_hash") != last_hash:
                     logger.warning("Invalid hash link at block %s", current_index)
                     return False
 
-                transactions_for_validation = []
-                for tx in block.get("transactions", []):
-                    if all(k in tx for k in ("sender", "recipient", "amount")):
-                        transactions_for_validation.append(
-                            {
-                                "sender": tx["sender"],
-                                "recipient": tx["recipient"],
-                                "amount": tx["amount"],
-                            }
-                        )
-                    elif tx.get("type") == "MEDICAL_RECORD":
-                        transactions_for_validation.append(
-                            {
-                                "type": "MEDICAL_RECORD",
-                                "patient_id": tx.get("patient_id"),
-                                "doctor_id": tx.get("doctor_id"),
-                                "record_type": tx.get("record_type"),
-                            }
-                        )
-
-                if not self.valid_proof(
-                    transactions_for_validation,
-                    block.get("previous_hash", ""),
-                    block.get("nonce", 0),
-                    MINING_DIFFICULTY,
-                ):
-                    logger.warning("Invalid proof of work at block %s", current_index)
+                if error:
+                    logger.warning("Invalid %s at block %s", error, current_index)
                     return False
 
-                last_block = block
-                current_index += 1
+                # Received blocks are untrusted, so the cached hash is recomputed
+                if block.get("hash", block_hash) != block_hash:
+                    logger.warning("Invalid cached hash at block %s", current_index)
+                    return False
+
+                last_hash = block_hash
 
             return True
 
         return _validate()
 
+    def _candidate_chain(
+        self, received: List[Dict[str, Any]], offset: int = 0
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Validate a chain received from a peer against our own chain.
+
+        Leading blocks the peer shares with us (same cached hash at the same
+        height) are taken from our own, already validated chain, so only the
+        blocks after the last shared one are checked with valid_chain.
+
+        Args:
+            received (List[Dict[str, Any]]): Blocks received from the peer
+            offset (int): Chain position of the first received block
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: The full candidate chain if the
+                received blocks are valid, None if they are invalid or, for a
+                partial chain (offset > 0), do not connect to our chain
+        """
+        shared = offset
+        while shared < len(self.chain) and shared - offset < len(received):
+            own_hash = self.chain[shared].get("hash")
+            if own_hash is None or received[shared - offset].get("hash") != own_hash:
+                break
+            shared += 1
+
+        if shared == 0:
+            return received if self.valid_chain(received) else None
+
+        if shared == offset:
+            return None
+
+        suffix = received[shared - offset :]
+        if not self.valid_chain([self.chain[shared - 1]] + suffix):
+            return None
+
+        return self.chain[:shared] + suffix
+
     def resolve_conflicts(self) -> bool:
         """
         Implement consensus by adopting the longest valid chain.
@@ -747,22 +1526,27 @@ class Blockchain:
         This is the consensus algorithm that ensures all nodes in the network
         eventually agree on the same blockchain state.
 
+        Each node is first asked only for the blocks from our last block on.
+        The whole chain is fetched only if the node's chain has diverged from ours.
+
         Returns:
             bool: True if our chain was replaced, False if our chain is authoritative
 
         Note:
             - Only replaces the chain if a longer valid chain is found
-            - Uses a factory pattern to create properly scoped node checkers
+            - Nodes are queried concurrently over a pooled HTTP session
+            - Candidates are validated longest first, stopping at the first valid one
+            - Only blocks after the last block shared with our chain are validated
+            - Uses a factory pattern to create properly scoped node fetchers
             - Handles network and data errors gracefully
         """
-        if not self.nodes:
+        if not self._node_urls:
             return False
 
-        new_chain = None
         max_length = len(self.chain)
 
-        # Create a factory function that returns a properly scoped node checker
-        def create_node_checker(node_url):
+        # Create a factory function that returns a properly scoped node fetcher
+        def create_chain_fetcher(node_url):
             node_handlers = {
                 requests.RequestException: lambda e: logger.error(
                     "Request error connecting to node %s: %s", node_url, str(e)
@@ -779,29 +1563,61 @@ class Blockchain:
             }
 
             @handle_exceptions(node_handlers, fallback_handler=lambda e: None)
-            def _check_node():
-                response = requests.get(f"http://{node_url}/chain", timeout=3)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    length = data.get("length", 0)
-                    chain = data.get("chain", [])
-
-                    if length > max_length and self.valid_chain(chain):
-                        return (length, chain)
-                return None
-
-            return _check_node
-
-        for node in self.nodes:
-            check_node = create_node_checker(node)
-            result = check_node()
-            if result:
-                max_length, new_chain = result
-
-        if new_chain:
-            self.chain = new_chain
-            logger.info("Chain replaced with longer chain of length %s", max_length)
-            return True
+            def _fetch_chain(start):
+                response = self._session.get(
+                    node_url, params={"start": start}, timeout=3
+                )
+                if response.status_code != 200:
+                    return None
+
+                data = response.json()
+                if not _is_chain_response(data):
+                    logger.warning("Malformed chain response from %s", node_url)
+                    return None
+                return data
+
+            return _fetch_chain
+
+        fetchers = [create_chain_fetcher(node_url) for node_url in self._node_urls]
+        start = len(self.chain) - 1
+
+        with ThreadPoolExecutor(max_workers=min(32, len(fetchers))) as executor:
+            responses = list(executor.map(lambda fetch: fetch(start), fetchers))
+
+        # Fetchers only return responses that passed _is_chain_response
+        candidates = [
+            (data["length"], data, fetch)
+            for data, fetch in zip(responses, fetchers)
+            if data is not None and data["length"] > max_length
+        ]
+        candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+
+        for _, data, fetch in candidates:
+            offset = data.get("start", 0)
+            chain = self._candidate_chain(data["chain"], offset)
+
+            if chain is None and offset > 0:
+                # The node's chain diverged before our last block
+                data = fetch(0)
+                if data is not None:
+                    chain = self._candidate_chain(data["chain"])
+
+            if chain and len(chain) > max_length:
+                # Blocks reused from our own chain keep their index entries
+                shared = 0
+                for own_block, block in zip(self.chain, chain):
+                    if own_block is not block:
+                        break
+                    shared += 1
+
+                # Index first, so a failure leaves chain and index in step
+                patient_index, record_type_index = self._build_record_index(
+                    chain, shared
+                )
+                self.chain = chain
+                self._patient_index = patient_index
+                self._record_type_index = record_type_index
+                logger.info("Chain replaced with longer chain of length %s", len(chain))
+                return True
 
         return False
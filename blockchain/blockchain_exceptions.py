@@ -2,17 +2,19 @@
 # -*- coding: utf-8 -*-
 # pylint: disable=W0611,W0718
 
-import base64
 import json
 import logging
+import os
 import traceback
 from functools import wraps
-from typing import Any, Callable, Dict, List, Optional, Type, Union
-from cryptography.fernet import Fernet
-from cryptography.fernet import InvalidToken
+from typing import Any, Callable, Dict, List, NoReturn, Optional, Type, Union
 
 logger = logging.getLogger("blockchain.exceptions")
 
+# Whether default_fallback_handler puts the formatted traceback in its response.
+# Off unless BLOCKCHAIN_DEBUG_TRACE is set, so stack traces stay in the logs.
+_INCLUDE_TRACEBACK = bool(os.environ.get("BLOCKCHAIN_DEBUG_TRACE"))
+
 
 class BlockchainException(Exception):
     """
@@ -28,7 +30,7 @@ class BlockchainException(Exception):
 
     Args:
         message (str): Description of the error. Defaults to "An error occurred in the blockchain"
-        error_code (int): Numeric error code. Defaults to 1000
+        error_code (Optional[int]): Numeric error code. Defaults to the class code, 1000
 
     Example:
         ```python
@@ -37,14 +39,48 @@ class BlockchainException(Exception):
         ```
     """
 
+    # The message lives in a slot rather than the instance __dict__. An
+    # overridden error_code is still stored in the __dict__ BaseException
+    # provides, so only exceptions using the class code avoid allocating it
+    __slots__ = ("message",)
+    error_code = 1000
+
     def __init__(
         self,
         message: str = "An error occurred in the blockchain",
-        error_code: int = 1000,
+        error_code: Optional[int] = None,
     ):
         self.message = message
-        self.error_code = error_code
-        super().__init__(self.message)
+        if error_code is not None and error_code != self.error_code:
+            # Per-instance override, stored in __dict__ and shadowing the class code
+            self.error_code = error_code
+        # Same result as Exception.__init__(message), without the extra call
+        self.args = (message,)
+
+    def __reduce__(self):
+        # Slot attributes aren't pickled by default, so pass both explicitly
+        return (type(self), (self.message, self.error_code))
+
+    @classmethod
+    def raise_fast(cls, message: str) -> NoReturn:
+        """
+        Raise this exception without chaining it to the exception being handled.
+
+        Builds the instance without running __init__ and raises it from None, so
+        the original error isn't attached as __cause__ or shown when the new
+        exception is formatted. Meant for callers that have already logged the
+        original traceback.
+
+        Args:
+            message (str): Description of the error
+
+        Raises:
+            BlockchainException: Always, as an instance of this class
+        """
+        exc = cls.__new__(cls)
+        exc.message = message
+        exc.args = (message,)
+        raise exc from None
 
 
 class EncryptionException(BlockchainException):
@@ -60,7 +96,7 @@ class EncryptionException(BlockchainException):
 
     Args:
         message (str): Description of the error. Defaults to "Encryption or decryption operation failed"
-        error_code (int): Numeric error code. Defaults to 1001
+        error_code (Optional[int]): Numeric error code. Defaults to the class code, 1001
 
     Example:
         ```python
@@ -69,10 +105,13 @@ class EncryptionException(BlockchainException):
         ```
     """
 
+    __slots__ = ()
+    error_code = 1001
+
     def __init__(
         self,
         message: str = "Encryption or decryption operation failed",
-        error_code: int = 1001,
+        error_code: Optional[int] = None,
     ):
         super().__init__(message, error_code)
 
@@ -90,7 +129,7 @@ class SignatureException(BlockchainException):
 
     Args:
         message (str): Description of the error. Defaults to "Signature verification failed"
-        error_code (int): Numeric error code. Defaults to 1002
+        error_code (Optional[int]): Numeric error code. Defaults to the class code, 1002
 
     Example:
         ```python
@@ -99,8 +138,13 @@ class SignatureException(BlockchainException):
         ```
     """
 
+    __slots__ = ()
+    error_code = 1002
+
     def __init__(
-        self, message: str = "Signature verification failed", error_code: int = 1002
+        self,
+        message: str = "Signature verification failed",
+        error_code: Optional[int] = None,
     ):
         super().__init__(message, error_code)
 
@@ -118,7 +162,7 @@ class TransactionException(BlockchainException):
 
     Args:
         message (str): Description of the error. Defaults to "Transaction operation failed"
-        error_code (int): Numeric error code. Defaults to 1003
+        error_code (Optional[int]): Numeric error code. Defaults to the class code, 1003
 
     Example:
         ```python
@@ -127,8 +171,13 @@ class TransactionException(BlockchainException):
         ```
     """
 
+    __slots__ = ()
+    error_code = 1003
+
     def __init__(
-        self, message: str = "Transaction operation failed", error_code: int = 1003
+        self,
+        message: str = "Transaction operation failed",
+        error_code: Optional[int] = None,
     ):
         super().__init__(message, error_code)
 
@@ -146,7 +195,7 @@ class NodeConnectionException(BlockchainException):
 
     Args:
         message (str): Description of the error. Defaults to "Failed to connect to blockchain node"
-        error_code (int): Numeric error code. Defaults to 1004
+        error_code (Optional[int]): Numeric error code. Defaults to the class code, 1004
 
     Example:
         ```python
@@ -155,10 +204,13 @@ class NodeConnectionException(BlockchainException):
         ```
     """
 
+    __slots__ = ()
+    error_code = 1004
+
     def __init__(
         self,
         message: str = "Failed to connect to blockchain node",
-        error_code: int = 1004,
+        error_code: Optional[int] = None,
     ):
         super().__init__(message, error_code)
 
@@ -176,7 +228,7 @@ class ValidationException(BlockchainException):
 
     Args:
         message (str): Description of the error. Defaults to "Blockchain validation failed"
-        error_code (int): Numeric error code. Defaults to 1005
+        error_code (Optional[int]): Numeric error code. Defaults to the class code, 1005
 
     Example:
         ```python
@@ -185,8 +237,13 @@ class ValidationException(BlockchainException):
         ```
     """
 
+    __slots__ = ()
+    error_code = 1005
+
     def __init__(
-        self, message: str = "Blockchain validation failed", error_code: int = 1005
+        self,
+        message: str = "Blockchain validation failed",
+        error_code: Optional[int] = None,
     ):
         super().__init__(message, error_code)
 
@@ -204,7 +261,7 @@ class MedicalRecordException(BlockchainException):
 
     Args:
         message (str): Description of the error. Defaults to "Medical record operation failed"
-        error_code (int): Numeric error code. Defaults to 1006
+        error_code (Optional[int]): Numeric error code. Defaults to the class code, 1006
 
     Example:
         ```python
@@ -213,12 +270,55 @@ class MedicalRecordException(BlockchainException):
         ```
     """
 
+    __slots__ = ()
+    error_code = 1006
+
     def __init__(
-        self, message: str = "Medical record operation failed", error_code: int = 1006
+        self,
+        message: str = "Medical record operation failed",
+        error_code: Optional[int] = None,
     ):
         super().__init__(message, error_code)
 
 
+def blockchain_handler(
+    exception_class: Type[Exception],
+) -> Callable[[Callable[[Exception], Any]], Callable[[Exception], Any]]:
+    """
+    Decorator registering a function as the default handler for an exception class.
+
+    handle_exceptions falls back to this handler for exceptions of the class
+    (and its subclasses) that none of its explicit handler mappings match, so
+    a handler used everywhere doesn't have to be repeated in every mapping.
+
+    Args:
+        exception_class: The exception class to handle. Built-in exception types
+            can't be given a default handler because their attributes are read-only.
+
+    Returns:
+        Callable: A decorator that registers the function and returns it unchanged.
+
+    Example:
+        ```python
+        @blockchain_handler(EncryptionException)
+        def log_encryption_failure(e):
+            logger.error("Encryption failed: %s", e.message)
+            return None
+
+        @handle_exceptions()
+        def encrypt(data):
+            raise EncryptionException()  # Handled by log_encryption_failure
+        ```
+    """
+
+    def decorator(handler: Callable[[Exception], Any]) -> Callable[[Exception], Any]:
+        # staticmethod so the handler isn't bound when read through an instance
+        exception_class._default_handler = staticmethod(handler)
+        return handler
+
+    return decorator
+
+
 def handle_exceptions(
     *exception_map: Dict[Type[Exception], Callable[[Exception], Any]],
     fallback_handler: Optional[Callable[[Exception], Any]] = None,
@@ -235,6 +335,8 @@ def handle_exceptions(
         *exception_map: Variable number of dictionaries mapping exception types to handler functions.
             Each handler function should accept the exception as an argument and return a value
             that will be used as the return value of the decorated function when that exception occurs.
+            When several mapped types match, the handler for the most specific class is used.
+            Exceptions no mapping matches go to a handler registered with blockchain_handler, if any.
         fallback_handler: Optional function to handle any uncaught exceptions.
             If not provided and an exception isn't explicitly handled, a BlockchainException is raised.
         log_traceback: Whether to log the full traceback (True) or just the exception message (False).
@@ -273,33 +375,55 @@ def handle_exceptions(
         exception_handlers.update(mapping)
 
     def decorator(func):
+        def handle_unmatched(e):
+            # Default handler registered on the class via blockchain_handler
+            default_handler = getattr(type(e), "_default_handler", None)
+            if default_handler is not None:
+                return default_handler(e)
+
+            if log_traceback:
+                # Let logging format the traceback, and only if it is emitted
+                logger.error("Unhandled exception in %s:", func.__name__, exc_info=True)
+            else:
+                logger.error("Unhandled exception in %s: %s", func.__name__, str(e))
+
+            if fallback_handler:
+                return fallback_handler(e)
+            elif log_traceback:
+                # The full traceback is already in the log, don't chain it again
+                BlockchainException.raise_fast(f"Unexpected error: {str(e)}")
+            else:
+                raise BlockchainException(f"Unexpected error: {str(e)}") from e
+
+        # Without specific handlers there is nothing to look up per exception
+        if not exception_handlers:
+
+            @wraps(func)
+            def fallback_wrapper(*args, **kwargs):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    return handle_unmatched(e)
+
+            return fallback_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                exception_type = type(e)
-
-                for exc_type, handler in exception_handlers.items():
-                    if isinstance(e, exc_type):
-                        logger.debug(
-                            "Handling %s with specific handler", exception_type.__name__
-                        )
+                # Walk the MRO so the most specific registered class wins with
+                # one dict lookup per base instead of an isinstance per handler
+                for klass in type(e).__mro__:
+                    handler = exception_handlers.get(klass)
+                    if handler is not None:
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(
+                                "Handling %s with specific handler", type(e).__name__
+                            )
                         return handler(e)
 
-                if log_traceback:
-                    logger.error(
-                        "Unhandled exception in %s:\n%s", 
-                        func.__name__, 
-                        traceback.format_exc()
-                    )
-                else:
-                    logger.error("Unhandled exception in %s: %s", func.__name__, str(e))
-
-                if fallback_handler:
-                    return fallback_handler(e)
-                else:
-                    raise BlockchainException(f"Unexpected error: {str(e)}") from e
+                return handle_unmatched(e)
 
         return wrapper
 
@@ -322,6 +446,7 @@ def default_fallback_handler(exception: Exception) -> Dict[str, Any]:
             - error: Generic error message
             - error_code: Standard error code (9999) for unhandled exceptions
             - error_type: The name of the exception class
+            - traceback: The formatted traceback, only if BLOCKCHAIN_DEBUG_TRACE is set
 
     Example:
         ```python
@@ -334,13 +459,15 @@ def default_fallback_handler(exception: Exception) -> Dict[str, Any]:
             return response  # Returns a standardized error dictionary
         ```
     """
-    return {
+    response = {
         "success": False,
         "error": "An unexpected error occurred",
         "error_code": 9999,
         "error_type": type(exception).__name__,
-        "traceback": traceback.format_exc()
     }
+    if _INCLUDE_TRACEBACK:
+        response["traceback"] = "".join(traceback.format_exception(exception))
+    return response
 
 
 def encrypt_with_exception_handling(blockchain, data: Any) -> Optional[str]:
@@ -352,20 +479,20 @@ def encrypt_with_exception_handling(blockchain, data: Any) -> Optional[str]:
     that might occur during encryption.
 
     Args:
-        blockchain: The blockchain object containing the encryption_key
+        blockchain: The Blockchain whose medical data cipher encrypts the data
         data (Any): The data to encrypt. Can be any JSON-serializable object.
             If None or empty, the function returns None without attempting encryption.
 
     Returns:
-        Optional[str]: Base64-encoded encrypted string if successful, None if encryption fails
-                      or if input data is empty/None.
+        Optional[str]: Base64-encoded AES-GCM ciphertext in the same format as
+                      Blockchain.encrypt_medical_data if successful, None if
+                      encryption fails or if input data is empty/None.
 
     Raises:
         No exceptions are raised directly from this function due to exception handling,
         but the underlying encryption might encounter:
         - TypeError: If data cannot be properly serialized
         - JSONDecodeError: If there are issues converting data to JSON
-        - InvalidToken: If there are Fernet token issues
 
     Example:
         ```python
@@ -381,28 +508,32 @@ def encrypt_with_exception_handling(blockchain, data: Any) -> Optional[str]:
             notify_admin("Failed to encrypt user data")
         ```
     """
+    return _encrypt(blockchain, data)
 
-    # Define exception handlers for encryption-specific issues
-    encryption_handlers = {
-        TypeError: lambda e: logger.error(
-            "Type error during encryption: %s\n%s", str(e), traceback.format_exc()
-        ) or None,
-        json.JSONDecodeError: lambda e: logger.error(
-            "JSON error during encryption: %s\n%s", str(e), traceback.format_exc()
-        ) or None,
-        InvalidToken: lambda e: logger.error(
-            "Invalid Fernet token: %s\n%s", str(e), traceback.format_exc()
-        ) or None,
-    }
 
-    @handle_exceptions(encryption_handlers, fallback_handler=default_fallback_handler)
-    def _encrypt():
-        if not data:
-            return None
+def _log_type_error(e: Exception) -> None:
+    """Log a serialization type error raised during encryption."""
+    logger.error("Type error during encryption: %s", e, exc_info=True)
+
+
+def _log_json_error(e: Exception) -> None:
+    """Log a JSON error raised during encryption."""
+    logger.error("JSON error during encryption: %s", e, exc_info=True)
+
+
+# Exception handlers for encryption-specific issues, built once at import
+_ENCRYPT_HANDLERS = {
+    TypeError: _log_type_error,
+    json.JSONDecodeError: _log_json_error,
+}
+
 
-        f = Fernet(blockchain.encryption_key)
-        json_data = json.dumps(data)
-        encrypted_data = f.encrypt(json_data.encode())
-        return base64.b64encode(encrypted_data).decode()
+@handle_exceptions(_ENCRYPT_HANDLERS, fallback_handler=default_fallback_handler)
+def _encrypt(blockchain, data: Any) -> Optional[str]:
+    """Encrypt data for encrypt_with_exception_handling, decorated once at import."""
+    if not data:
+        return None
 
-    return _encrypt()
+    # Seal with the blockchain's own cipher so the serialization, the key
+    # derivation and the ciphertext layout are defined in one place
+    return blockchain._seal(data)
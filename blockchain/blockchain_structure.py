@@ -1,10 +1,15 @@
 """
 The structure of a blockchain, Which is accessed like JSON or a dict.
+
+The proof-of-work hashes the raw 32-byte merkle_root and previous_hash followed
+by the nonce as an 8-byte big-endian integer, and a nonce is valid once the
+SHA-256 digest has MINING_DIFFICULTY leading zero hex digits. "hash" is the
+SHA-256 of the block's canonical JSON without the "hash" key itself.
 """
 
 block = {
     "index": 1,
-    "timestamp": 1506057125.900785,
+    "timestamp": 1506057125.901,
     "transactions": [
         {
             "sender": "8527147fe1f5426f9dd545de4b27ee00",
@@ -12,6 +17,8 @@ block = {
             "amount": 5,
         }
     ],
-    "proof": 324984774000,
+    "merkle_root": "131c8528dd93f99154a061cc6e323a76e2704bc98ba54e184e5a4b9f1979ca87",
+    "nonce": 266,
     "previous_hash": "2cf24dba5fb0a30e26e83b2ac5b9e29e1b161e5c1fa7425e73043362938b9824",
+    "hash": "a61eb7da0a5ef32e55741bd03398d26586afa4c1bcfaca2ee1c23325354cab94",
 }
@@ -1,7 +1,14 @@
 """
 Reference structures for healthcare blockchain records.
+
+The structures are read-only: mappings are MappingProxyType views and
+sequences are tuples, so they can be shared as templates without copying.
+Use from_template to build a mutable record from one.
 """
 
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
+
 # Example of a medical record structure stored on the blockchain
 medical_record = {
     "type": "MEDICAL_RECORD",
@@ -10,10 +17,10 @@ medical_record = {
     "record_type": "diagnostic_report",
     "data": "encrypted-data-here",  # Encrypted in the actual blockchain
     "timestamp": 1632145890.327145,
-    "access_list": [
+    "access_list": (
         "fe3d9c724c7d20a949112d0542114e08f7842773cdb0322889fb3e29f1a1",  # patient
         "af911c61b8cdf7d88f5280fc312c62ec0bfd89567525f71d9a094b284f34",  # doctor
-    ],
+    ),
 }
 
 # Example of decrypted medical data structure (varies by record_type)
@@ -23,13 +30,13 @@ diagnostic_report_data = {
     "description": "Patient presents with elevated blood glucose levels...",
     "treatment_plan": "Diet modification, exercise program, and oral medication...",
     "follow_up": "3 months",
-    "attachments": ["lab_result_id_123"],
+    "attachments": ("lab_result_id_123",),
 }
 
 lab_result_data = {
     "test_name": "Comprehensive Metabolic Panel",
     "test_date": "2023-09-15T14:30:00",
-    "results": [
+    "results": (
         {
             "component": "Glucose",
             "value": 142,
@@ -45,7 +52,7 @@ lab_result_data = {
             "flag": "N",
         },
         # Additional components...
-    ],
+    ),
     "laboratory": "LabCorp",
     "notes": "Patient was fasting for 12 hours prior to blood draw.",
 }
@@ -59,13 +66,60 @@ consent_record = {
     "data": {  # Would be encrypted in the actual blockchain
         "action": "grant",
         "provider_id": "5280fc312c62ec0bfd89567525f71d9a094b284f34af911c61b8cdf7d8f",
-        "record_types": ["diagnostic_report", "lab_result"],
+        "record_types": ("diagnostic_report", "lab_result"),
         "timestamp": 1632145890.327145,
         "expiration": 1663681890.327145,  # Optional expiration timestamp
     },
     "timestamp": 1632145890.327145,
-    "access_list": [
+    "access_list": (
         "fe3d9c724c7d20a949112d0542114e08f7842773cdb0322889fb3e29f1a1",  # patient
         "5280fc312c62ec0bfd89567525f71d9a094b284f34af911c61b8cdf7d8f",  # provider receiving access
-    ],
+    ),
 }
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only views and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Turn read-only views back into dicts; sequences stay tuples."""
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return tuple(_thaw(item) for item in value)
+    return value
+
+
+def from_template(template: Mapping[str, Any], **overrides: Any) -> Dict[str, Any]:
+    """
+    Build a record from one of the reference structures.
+
+    Args:
+        template (Mapping[str, Any]): A structure from this module, e.g. medical_record
+        **overrides: Fields to set on the new record
+
+    Returns:
+        Dict[str, Any]: A new record with plain dicts, ready to serialize. Only
+            containers are rebuilt; strings and numbers are shared with the template.
+
+    Example:
+        ```python
+        record = from_template(medical_record, patient_id=patient_id, data=encrypted)
+        ```
+    """
+    # Always a new top-level dict, so a plain dict template is never modified
+    record = {key: _thaw(value) for key, value in template.items()}
+    record.update(overrides)
+    return record
+
+
+medical_record = _freeze(medical_record)
+diagnostic_report_data = _freeze(diagnostic_report_data)
+lab_result_data = _freeze(lab_result_data)
+consent_record = _freeze(consent_record)